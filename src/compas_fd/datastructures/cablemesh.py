@@ -14,8 +14,10 @@ class CableMesh(Mesh):
     if not compas.IPY:
         from compas_fd.fd import mesh_fd_numpy
         from compas_fd.fd import mesh_fd_constrained_numpy
+        from compas_fd.fd.mesh_numerical_data import mesh_numerical_data
         fd_numpy = mesh_fd_numpy
         fd_constrained_numpy = mesh_fd_constrained_numpy
+        to_numdata = mesh_numerical_data
 
     def __init__(self):
         super(CableMesh, self).__init__()
@@ -7,10 +7,14 @@ from typing import Optional
 from typing_extensions import Annotated
 from nptyping import NDArray
 
-from numpy import asarray
+from numpy import copyto
+from numpy import einsum
+from numpy import empty_like
 from numpy import float64
-from scipy.linalg import norm
-from scipy.sparse.linalg import spsolve
+from numpy import sqrt
+from numpy import zeros
+from scipy.sparse.linalg import splu
+from scipy.sparse.linalg import SuperLU
 
 from compas.numerical import normrow
 
@@ -35,11 +39,16 @@ def fd_constrained_numpy(*,
     Vertex constraints are recomputed at each iteration.
     """
     nd = FDNumericalData.from_params(vertices, fixed, edges, forcedensities, loads)
+    Ai_lu = splu(nd.Ai)
+    constrained = [vertex for vertex, constraint in enumerate(constraints) if constraint]
+    constraints = [constraints[vertex] for vertex in constrained]
+    nd.tangent_residuals = zeros((len(constrained), 3), dtype=float64)
+    xyz_prev = empty_like(nd.xyz)
 
     for k in range(kmax):
-        xyz_prev = nd.xyz
-        _solve_fd(nd)
-        _update_constraints(nd, constraints)
+        copyto(xyz_prev, nd.xyz)
+        _solve_fd(nd, Ai_lu)
+        _update_constraints(nd, constrained, constraints)
         if (_is_converged_residuals(nd.tangent_residuals, tol_res) and
            _is_converged_disp(xyz_prev, nd.xyz, tol_disp)):
             break
@@ -48,13 +57,15 @@ def fd_constrained_numpy(*,
     return nd.to_result()
 
 
-def _solve_fd(numdata: FDNumericalData) -> None:
+def _solve_fd(numdata: FDNumericalData, Ai_lu: SuperLU) -> None:
     """Solve a single iteration for the equilibrium coordinates of a system.
+    The free stiffness block does not change between iterations,
+    so its factorization Ai_lu is computed once and reused for every solve.
     All updated numerical arrays are stored in the numdata parameter.
     """
     nd = numdata
     b = nd.p[nd.free] - nd.Af.dot(nd.xyz[nd.fixed])
-    nd.xyz[nd.free] = spsolve(nd.Ai, b)
+    nd.xyz[nd.free] = Ai_lu.solve(b)
     numdata.residuals = nd.p - nd.A.dot(nd.xyz)
 
 
@@ -68,18 +79,21 @@ def _post_process_fd(numdata: FDNumericalData) -> None:
 
 
 def _update_constraints(numdata: FDNumericalData,
+                        constrained: Sequence[int],
                         constraints: Sequence[Constraint]) -> None:
     """Update all vertex constraints by the residuals of the current iteration,
     and store their updated vertex coordinates in the numdata parameter.
+    The constraints are given for the constrained vertex indices only.
+    The tangent residuals are written in place into the preallocated
+    tangent_residuals array of the numdata parameter.
     """
     nd = numdata
-    for vertex, constraint in enumerate(constraints):
-        if not constraint:
-            continue
+    for index, (vertex, constraint) in enumerate(zip(constrained, constraints)):
         constraint.location = nd.xyz[vertex]
         constraint.residual = nd.residuals[vertex]
-        nd.xyz[vertex] = constraint.location + constraint.tangent * 0.5
-    nd.tangent_residuals = asarray([c.tangent for c in constraints if c])
+        tangent = constraint.tangent
+        nd.xyz[vertex] = constraint.location + tangent * 0.5
+        nd.tangent_residuals[index] = tangent
 
 
 def _is_converged_residuals(residuals: NDArray[(Any, 3), float64],
@@ -87,7 +101,7 @@ def _is_converged_residuals(residuals: NDArray[(Any, 3), float64],
     """Verify whether the maximum constraint residual is within tolerance."""
     if residuals is None or not residuals.any():
         return True
-    max_res = max(norm(residuals, axis=1))
+    max_res = sqrt(einsum('ij,ij->i', residuals, residuals).max())
     return max_res < tol_res
 
 
@@ -97,5 +111,6 @@ def _is_converged_disp(old_xyz: NDArray[(Any, 3), float64],
     """Verify whether the maximum coordinate displacement
     between consecutive iterations is within tolerance.
     """
-    max_dxyz = max(norm(new_xyz - old_xyz, axis=1))
+    dxyz = new_xyz - old_xyz
+    max_dxyz = sqrt(einsum('ij,ij->i', dxyz, dxyz).max())
     return max_dxyz < tol_disp
@@ -0,0 +1,91 @@
+from typing import Any
+from typing import Tuple
+from typing import List
+from typing import Union
+from nptyping import NDArray
+
+from numpy import arange
+from numpy import asarray
+from numpy import empty
+from numpy import float64
+from numpy import int32
+from scipy.sparse import coo_matrix
+from scipy.sparse import csr_matrix
+
+
+def connectivity_matrix(edges: Union[List[Tuple[int, int]], NDArray[(Any, 2), int]],
+                        vertex_count: int
+                        ) -> csr_matrix:
+    """Construct the sparse edge-vertex connectivity matrix of a network.
+
+    Parameters
+    ----------
+    edges : list of tuple of int or array of int
+        Pairs of vertex indices.
+    vertex_count : int
+        Total number of vertices, including those not connected to any edge.
+
+    Returns
+    -------
+    :class:`scipy.sparse.csr_matrix`
+        Matrix of shape (edges, vertices) with -1 in the column of the start vertex
+        and +1 in the column of the end vertex of every edge.
+
+    Notes
+    -----
+    Every row holds exactly two entries, so the CSR arrays are filled directly,
+    without an intermediate COO matrix.
+
+    """
+    edges = asarray(edges, dtype=int32).reshape((-1, 2))
+    m = edges.shape[0]
+    data = empty(2 * m, dtype=float64)
+    data[0::2] = -1.0
+    data[1::2] = 1.0
+    indices = edges.flatten()
+    indptr = arange(0, 2 * m + 1, 2, dtype=int32)
+    return csr_matrix((data, indices, indptr), shape=(m, vertex_count))
+
+
+def stiffness_matrix(edges: Union[List[Tuple[int, int]], NDArray[(Any, 2), int]],
+                     forcedensities: Union[List[float], NDArray[(Any, 1), float64]],
+                     vertex_count: int
+                     ) -> csr_matrix:
+    """Construct the sparse force density stiffness matrix of a network.
+
+    Parameters
+    ----------
+    edges : list of tuple of int or array of int
+        Pairs of vertex indices.
+    forcedensities : list of float or array of float
+        Force density of every edge.
+    vertex_count : int
+        Total number of vertices, including those not connected to any edge.
+
+    Returns
+    -------
+    :class:`scipy.sparse.csr_matrix`
+        Matrix of shape (vertices, vertices), equal to ``C.T * Q * C``.
+
+    Notes
+    -----
+    Every edge contributes its force density to the diagonal entries of both of its vertices,
+    and its negated force density to the two off-diagonal entries coupling them.
+    The contributions are scattered in a single pass, without the intermediate sparse products.
+
+    """
+    edges = asarray(edges, dtype=int32).reshape((-1, 2))
+    q = asarray(forcedensities, dtype=float64).reshape(-1)
+    m = edges.shape[0]
+    u = edges[:, 0]
+    v = edges[:, 1]
+    data = empty(4 * m, dtype=float64)
+    data[:m] = data[m:2 * m] = q
+    data[2 * m:3 * m] = data[3 * m:] = -q
+    rows = empty(4 * m, dtype=int32)
+    cols = empty(4 * m, dtype=int32)
+    rows[:m] = cols[:m] = u
+    rows[m:2 * m] = cols[m:2 * m] = v
+    rows[2 * m:3 * m] = cols[3 * m:] = u
+    rows[3 * m:] = cols[2 * m:3 * m] = v
+    return coo_matrix((data, (rows, cols)), shape=(vertex_count, vertex_count)).tocsr()
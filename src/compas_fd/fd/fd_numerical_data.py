@@ -11,20 +11,27 @@ from dataclasses import dataclass
 from dataclasses import astuple
 
 from numpy import asarray
+from numpy import flatnonzero
 from numpy import float64
+from numpy import int32
+from numpy import ones
 from numpy import zeros_like
 from scipy.sparse import diags
 
-from compas.numerical import connectivity_matrix
-
+from .fd_matrices import connectivity_matrix
+from .fd_matrices import stiffness_matrix
+from .mesh_numerical_data import mesh_numerical_data
 from .result import Result
 
 
 @dataclass
 class FDNumericalData:
-    """Stores numerical data used by the force density algorithms."""
-    free: int
-    fixed: int
+    """Stores numerical data used by the force density algorithms.
+    The free stiffness block Ai is stored in CSC format for the sparse solvers,
+    all other sparse matrices in CSR format for matrix-vector products.
+    """
+    free: NDArray[(Any,), int32]
+    fixed: NDArray[(Any,), int32]
     xyz: NDArray[(Any, 3), float64]
     C: NDArray[(Any, Any), int]
     q: NDArray[(Any, 1), float64]
@@ -50,24 +57,27 @@ class FDNumericalData:
                     forcedensities: List[float],
                     loads: Optional[Union[Sequence[Annotated[List[float], 3]], NDArray[(Any, 3), float64]]] = None):
         """Construct numerical arrays from force density solver input parameters."""
-        free = list(set(range(len(vertices))) - set(fixed))
+        fixed = asarray(fixed, dtype=int32)
+        is_free = ones(len(vertices), dtype=bool)
+        is_free[fixed] = False
+        free = flatnonzero(is_free).astype(int32)
         xyz = asarray(vertices, dtype=float64).reshape((-1, 3))
-        C = connectivity_matrix(edges, 'csr')
-        Ci = C[:, free]
-        Cf = C[:, fixed]
+        C = connectivity_matrix(edges, len(vertices))
         q = asarray(forcedensities, dtype=float64).reshape((-1, 1))
         Q = diags([q.flatten()], [0])
         p = (zeros_like(xyz) if loads is None else
              asarray(loads, dtype=float64).reshape((-1, 3)))
-        A = C.T.dot(Q).dot(C)
-        Ai = Ci.T.dot(Q).dot(Ci)
-        Af = Ci.T.dot(Q).dot(Cf)
+        A = stiffness_matrix(edges, q, len(vertices))
+        A_free = A[free]
+        Ai = A_free[:, free].tocsc()
+        Af = A_free[:, fixed]
         return cls(free, fixed, xyz, C, q, Q, p, A, Ai, Af)
 
     @classmethod
     def from_mesh(cls, mesh):
         """Construct numerical arrays from input mesh."""
-        raise NotImplementedError
+        xyz, loads, fixed, edges, forcedensities, _ = mesh_numerical_data(mesh)
+        return cls.from_params(xyz, fixed, edges, forcedensities, loads)
 
     def to_result(self) -> Result:
         """Parse relevant numerical data into a Result object."""
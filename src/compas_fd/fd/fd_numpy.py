@@ -8,13 +8,16 @@ from typing_extensions import Annotated
 from nptyping import NDArray
 
 from numpy import asarray, zeros_like
+from numpy import flatnonzero
 from numpy import float64
-from scipy.sparse import diags
+from numpy import int32
+from numpy import ones
 from scipy.sparse.linalg import spsolve
 
-from compas.numerical import connectivity_matrix
 from compas.numerical import normrow
 
+from .fd_matrices import connectivity_matrix
+from .fd_matrices import stiffness_matrix
 from .result import Result
 
 
@@ -29,23 +32,24 @@ def fd_numpy(*,
     Compute the equilibrium coordinates of a system of vertices connected by edges.
     """
     v = len(vertices)
-    free = list(set(range(v)) - set(fixed))
+    fixed = asarray(fixed, dtype=int32)
+    is_free = ones(v, dtype=bool)
+    is_free[fixed] = False
+    free = flatnonzero(is_free).astype(int32)
     xyz = asarray(vertices, dtype=float64).reshape((-1, 3))
     q = asarray(forcedensities, dtype=float64).reshape((-1, 1))
     if loads is None:
         p = zeros_like(xyz)
     else:
         p = asarray(loads, dtype=float64).reshape((-1, 3))
-    C = connectivity_matrix(edges, 'csr')
-    Ci = C[:, free]
-    Cf = C[:, fixed]
-    Ct = C.transpose()
-    Cit = Ci.transpose()
-    Q = diags([q.flatten()], [0])
-    A = Cit.dot(Q).dot(Ci)
-    b = p[free] - Cit.dot(Q).dot(Cf).dot(xyz[fixed])
-    xyz[free] = spsolve(A, b)
+    C = connectivity_matrix(edges, v)
+    A = stiffness_matrix(edges, q, v)
+    A_free = A[free]
+    Ai = A_free[:, free].tocsc()
+    Af = A_free[:, fixed]
+    b = p[free] - Af.dot(xyz[fixed])
+    xyz[free] = spsolve(Ai, b)
     lengths = normrow(C.dot(xyz))
     forces = q * lengths
-    residuals = p - Ct.dot(Q).dot(C).dot(xyz)
+    residuals = p - A.dot(xyz)
     return Result(xyz, residuals, forces, lengths)
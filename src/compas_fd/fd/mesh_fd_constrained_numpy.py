@@ -1,8 +1,6 @@
-from numpy import array, asarray
-from numpy import float64
-
 import compas_fd
 from .fd_constrained_numpy import fd_constrained_numpy
+from .mesh_numerical_data import mesh_numerical_data
 
 
 def mesh_fd_constrained_numpy(mesh: 'compas_fd.datastructures.CableMesh') -> 'compas_fd.datastructures.CableMesh':
@@ -21,13 +19,7 @@ def mesh_fd_constrained_numpy(mesh: 'compas_fd.datastructures.CableMesh') -> 'co
         for compatibility with RPCs.
 
     """
-    v_i = mesh.vertex_index()
-    vertices = array(mesh.vertices_attributes('xyz'), dtype=float64)
-    fixed = [v_i[v] for v in mesh.vertices_where({'is_anchor': True})]
-    edges = [(v_i[u], v_i[v]) for u, v in mesh.edges_where({'_is_edge': True})]
-    forcedensities = asarray([attr['q'] for edge, attr in mesh.edges_where({'_is_edge': True}, True)], dtype=float64).reshape((-1, 1))
-    loads = array(mesh.vertices_attributes(('px', 'py', 'pz')), dtype=float64)
-    constraints = list(mesh.vertices_attribute('constraint'))
+    vertices, loads, fixed, edges, forcedensities, constraints = mesh_numerical_data(mesh)
 
     result = fd_constrained_numpy(vertices=vertices,
                                   fixed=fixed,
@@ -45,16 +37,14 @@ def mesh_fd_constrained_numpy(mesh: 'compas_fd.datastructures.CableMesh') -> 'co
 
 
 def _update_mesh(mesh, result):
-    vertex_index = mesh.vertex_index()
-    for vertex, attr in mesh.vertices(True):
-        index = vertex_index[vertex]
-        attr['x'] = result.vertices[index, 0]
-        attr['y'] = result.vertices[index, 1]
-        attr['z'] = result.vertices[index, 2]
-        attr['_rx'] = result.residuals[index, 0]
-        attr['_ry'] = result.residuals[index, 1]
-        attr['_rz'] = result.residuals[index, 2]
-
-    for index, (vertex, attr) in enumerate(mesh.edges_where({'_is_edge': True}, True)):
-        attr['_f'] = result.forces[index, 0]
-        attr['_l'] = result.lenghts[index, 0]
+    points = result.vertices.tolist()
+    residuals = result.residuals.tolist()
+    for (vertex, attr), point, residual in zip(mesh.vertices(True), points, residuals):
+        attr['x'], attr['y'], attr['z'] = point
+        attr['_rx'], attr['_ry'], attr['_rz'] = residual
+
+    forces = result.forces[:, 0].tolist()
+    lengths = result.lenghts[:, 0].tolist()
+    for (vertex, attr), force, length in zip(mesh.edges_where({'_is_edge': True}, True), forces, lengths):
+        attr['_f'] = force
+        attr['_l'] = length
@@ -1,9 +1,7 @@
-from numpy import array
-from numpy import float64
-
 import compas_fd
 from compas_fd.loads import SelfweightCalculator
 from .fd_numpy import fd_numpy
+from .mesh_numerical_data import mesh_numerical_data
 
 
 def mesh_fd_numpy(mesh: 'compas_fd.datastructures.CableMesh') -> 'compas_fd.datastructures.CableMesh':
@@ -22,30 +20,23 @@ def mesh_fd_numpy(mesh: 'compas_fd.datastructures.CableMesh') -> 'compas_fd.data
         for compatibility with RPCs.
 
     """
-    k_i = mesh.key_index()
-    fixed = mesh.vertices_where({'is_anchor': True})
-    fixed = [k_i[key] for key in fixed]
-    xyz = array(mesh.vertices_attributes('xyz'), dtype=float64)
-    p = array(mesh.vertices_attributes(('px', 'py', 'pz')), dtype=float64)
-    edges = [(k_i[u], k_i[v]) for u, v in mesh.edges_where({'_is_edge': True})]
-    q = array([attr['q'] for key, attr in mesh.edges_where({'_is_edge': True}, True)], dtype=float64).reshape((-1, 1))
+    xyz, p, fixed, edges, q, _ = mesh_numerical_data(mesh)
     density = mesh.attributes['density']
     calculate_sw = SelfweightCalculator(mesh, density=density)
     p[:, 2] -= calculate_sw(xyz)[:, 0]
 
     result = fd_numpy(vertices=xyz, fixed=fixed, edges=edges, forcedensities=q, loads=p)
 
-    for key, attr in mesh.vertices(True):
-        index = k_i[key]
-        attr['x'] = result.vertices[index, 0]
-        attr['y'] = result.vertices[index, 1]
-        attr['z'] = result.vertices[index, 2]
-        attr['_rx'] = result.residuals[index, 0]
-        attr['_ry'] = result.residuals[index, 1]
-        attr['_rz'] = result.residuals[index, 2]
-
-    for index, (key, attr) in enumerate(mesh.edges_where({'_is_edge': True}, True)):
-        attr['_f'] = result.forces[index, 0]
-        attr['_l'] = result.lenghts[index, 0]
+    points = result.vertices.tolist()
+    residuals = result.residuals.tolist()
+    for (key, attr), point, residual in zip(mesh.vertices(True), points, residuals):
+        attr['x'], attr['y'], attr['z'] = point
+        attr['_rx'], attr['_ry'], attr['_rz'] = residual
+
+    forces = result.forces[:, 0].tolist()
+    lengths = result.lenghts[:, 0].tolist()
+    for (key, attr), force, length in zip(mesh.edges_where({'_is_edge': True}, True), forces, lengths):
+        attr['_f'] = force
+        attr['_l'] = length
 
     return mesh
@@ -0,0 +1,69 @@
+from typing import Any
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from nptyping import NDArray
+
+from numpy import array
+from numpy import float64
+from numpy import int32
+
+import compas_fd
+from compas_fd.constraints import Constraint
+
+
+class MeshNumericalData(NamedTuple):
+    xyz: NDArray[(Any, 3), float64]
+    loads: NDArray[(Any, 3), float64]
+    fixed: NDArray[(Any,), int32]
+    edges: NDArray[(Any, 2), int32]
+    forcedensities: NDArray[(Any, 1), float64]
+    constraints: List[Optional[Constraint]]
+
+
+def mesh_numerical_data(mesh: 'compas_fd.datastructures.CableMesh') -> MeshNumericalData:
+    """Collect the numerical input of the force density solvers from a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`compas_fd.datastructures.CableMesh`
+        The mesh to convert.
+
+    Returns
+    -------
+    :class:`MeshNumericalData`
+        The vertex coordinates, loads, anchors and constraints in vertex index order,
+        and the vertex index pairs and force densities of the edges
+        in the order of ``mesh.edges_where({'_is_edge': True})``.
+
+    Notes
+    -----
+    The vertex and edge attributes are read in a single pass over the vertices
+    and a single pass over the edges of the mesh.
+
+    """
+    key_index = {}
+    xyz = []
+    loads = []
+    fixed = []
+    constraints = []
+    for index, (key, attr) in enumerate(mesh.vertices(True)):
+        key_index[key] = index
+        xyz.append((attr['x'], attr['y'], attr['z']))
+        loads.append((attr['px'], attr['py'], attr['pz']))
+        if attr['is_anchor']:
+            fixed.append(index)
+        constraints.append(attr['constraint'])
+
+    edges = []
+    forcedensities = []
+    for (u, v), attr in mesh.edges_where({'_is_edge': True}, True):
+        edges.append((key_index[u], key_index[v]))
+        forcedensities.append(attr['q'])
+
+    return MeshNumericalData(array(xyz, dtype=float64).reshape((-1, 3)),
+                             array(loads, dtype=float64).reshape((-1, 3)),
+                             array(fixed, dtype=int32),
+                             array(edges, dtype=int32).reshape((-1, 2)),
+                             array(forcedensities, dtype=float64).reshape((-1, 1)),
+                             constraints)
@@ -1,58 +1,86 @@
+from numpy import arange
 from numpy import array
-from numpy import zeros
-
-from compas.geometry import cross_vectors
-from compas.geometry import length_vector
-from compas.numerical import face_matrix
+from numpy import bincount
+from numpy import concatenate
+from numpy import cross
+from numpy import cumsum
+from numpy import einsum
+from numpy import empty
+from numpy import float64
+from numpy import fromiter
+from numpy import int32
+from numpy import repeat
+from numpy import sqrt
+from scipy.sparse import coo_matrix
 
 
 class SelfweightCalculator:
 
     def __init__(self, mesh, density=1.0, thickness_attr_name='t'):
         self.mesh = mesh
-        self.rho = array([t * density for t in mesh.vertices_attribute(thickness_attr_name)]).reshape((-1, 1))
+        self.rho = array(mesh.vertices_attribute(thickness_attr_name), dtype=float64).reshape((-1, 1))
+        self.rho *= density
         self.key_index = mesh.key_index()
         self.fkey_index = {fkey: index for index, fkey in enumerate(mesh.faces())}
         self.is_loaded = {fkey: True for fkey in mesh.faces()}
+        self.face_vertices, self.face_sizes = self.face_arrays()
         self.F = self.face_matrix()
+        self.he_u, self.he_v, self.he_f = self.halfedge_face_arrays()
 
     def __call__(self, xyz):
         ta = self._tributary_areas(xyz)
-        return ta * self.rho
-
-    def face_matrix(self):
-        face_vertices = [None] * self.mesh.number_of_faces()
-        for fkey in self.mesh.faces():
-            face_vertices[self.fkey_index[fkey]] = [self.key_index[key] for key in self.mesh.face_vertices(fkey)]
-        return face_matrix(face_vertices, rtype='csr', normalize=True)
+        ta *= self.rho
+        return ta
 
-    def _tributary_areas(self, xyz):
+    def face_arrays(self):
+        """Flat array of the vertex indices of all faces, in face index order,
+        and the number of vertices of every face.
+        """
         mesh = self.mesh
         key_index = self.key_index
-        fkey_index = self.fkey_index
-        is_loaded = self.is_loaded
+        face_vertices = []
+        face_sizes = empty(mesh.number_of_faces(), dtype=int32)
+        for index, fkey in enumerate(mesh.faces()):
+            keys = mesh.face_vertices(fkey)
+            face_vertices.extend(key_index[key] for key in keys)
+            face_sizes[index] = len(keys)
+        return array(face_vertices, dtype=int32), face_sizes
 
-        C = self.F.dot(xyz)
-
-        areas = zeros((xyz.shape[0], 1))
-        for u in mesh.vertices():
-            p0 = xyz[key_index[u]]
+    def face_matrix(self):
+        f = self.face_sizes.shape[0]
+        rows = repeat(arange(f, dtype=int32), self.face_sizes)
+        data = repeat(1.0 / self.face_sizes, self.face_sizes)
+        F = coo_matrix((data, (rows, self.face_vertices)), shape=(f, len(self.key_index)))
+        return F.tocsr()
 
-            a = 0
-            for v in mesh.halfedge[u]:
-                p1 = xyz[key_index[v]]
-                p01 = p1 - p0
+    def halfedge_face_arrays(self):
+        """Index arrays of the start vertex, end vertex and adjacent face
+        of every halfedge-face pair contributing to the tributary areas.
+        Every halfedge (u, v) is paired with the faces on both of its sides,
+        i.e. each face contributes its own halfedges in both directions.
+        """
+        sizes = self.face_sizes
+        faces = repeat(arange(sizes.shape[0], dtype=int32), sizes)
+        start = repeat(cumsum(sizes) - sizes, sizes)
+        corner = arange(faces.shape[0], dtype=int32) - start
+        u = self.face_vertices
+        v = self.face_vertices[start + (corner + 1) % sizes[faces]]
+        return concatenate((u, v)), concatenate((v, u)), concatenate((faces, faces))
 
-                fkey = mesh.halfedge[u][v]
-                if fkey is not None and is_loaded[fkey]:
-                    p2 = C[fkey_index[fkey]]
-                    a += 0.25 * length_vector(cross_vectors(p01, p2 - p0))
+    def _tributary_areas(self, xyz):
+        is_loaded = fromiter(map(self.is_loaded.__getitem__, self.fkey_index), dtype=bool, count=len(self.fkey_index))
 
-                fkey = mesh.halfedge[v][u]
-                if fkey is not None and is_loaded[fkey]:
-                    p3 = C[fkey_index[fkey]]
-                    a += 0.25 * length_vector(cross_vectors(p01, p3 - p0))
+        C = self.F.dot(xyz)
 
-            areas[key_index[u]] = a
+        p0 = xyz[self.he_u]
+        p01 = xyz[self.he_v]
+        p01 -= p0
+        p02 = C[self.he_f]
+        p02 -= p0
+        n = cross(p01, p02)
+        a = sqrt(einsum('ij,ij->i', n, n))
+        a *= 0.25
+        a *= is_loaded[self.he_f]
 
-        return areas
+        areas = bincount(self.he_u, weights=a, minlength=xyz.shape[0])
+        return areas.reshape((-1, 1))
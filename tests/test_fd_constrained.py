@@ -0,0 +1,51 @@
+import sys
+import numpy as np
+from compas.geometry import Line
+from compas.geometry import Point
+from compas.geometry import closest_point_on_line
+from compas_fd.constraints import Constraint
+from compas_fd.fd import fd_numpy
+from compas_fd.fd import fd_constrained_numpy
+
+
+def test_unconstrained_matches_fd_numpy():
+    vertices = [[0, 0, 0], [0, 0, 1], [1, 0, 0], [1, 1, 1], [0, 1, 0], [0.5, 0.5, 0]]
+    edges = [(0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (5, 3)]
+    forcedensities = [1, 2, 1, 2, 1, 1]
+    loads = [[0, 0, -0.1]] * 6
+    fixed = [1, 2, 3, 4]
+    expected = fd_numpy(vertices=vertices, fixed=fixed, edges=edges, forcedensities=forcedensities, loads=loads)
+    result = fd_constrained_numpy(vertices=vertices, fixed=fixed, edges=edges, forcedensities=forcedensities, loads=loads,
+                                  constraints=[None] * 6)
+    assert np.allclose(result.vertices, expected.vertices)
+    assert np.allclose(result.residuals, expected.residuals)
+
+
+def test_line_constraint_on_anchor(monkeypatch):
+    module = sys.modules['compas_fd.fd.fd_constrained_numpy']
+    displacements = []
+    tangent_residuals = []
+    is_converged_disp = module._is_converged_disp
+    is_converged_residuals = module._is_converged_residuals
+
+    def record_disp(old_xyz, new_xyz, tol_disp):
+        displacements.append(np.abs(new_xyz - old_xyz).max())
+        return is_converged_disp(old_xyz, new_xyz, tol_disp)
+
+    def record_residuals(residuals, tol_res):
+        tangent_residuals.append(residuals.shape)
+        return is_converged_residuals(residuals, tol_res)
+
+    monkeypatch.setattr(module, '_is_converged_disp', record_disp)
+    monkeypatch.setattr(module, '_is_converged_residuals', record_residuals)
+
+    vertices = [[0, 0, 0], [0, 0, 1], [1, 0, 0], [1, 1, 1], [0, 1, 0], [0.5, 0.5, 0]]
+    edges = [(0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (5, 3)]
+    line = Line(Point(1, 1, 1), Point(2, 2, 0))
+    constraints = [None, None, None, Constraint(line), None, None]
+    result = fd_constrained_numpy(vertices=vertices, fixed=[1, 2, 3, 4], edges=edges, forcedensities=[1, 2, 1, 2, 1, 1],
+                                  loads=[[0, 0, -0.1]] * 6, constraints=constraints)
+
+    assert displacements and displacements[0] > 0
+    assert all(shape == (1, 3) for shape in tangent_residuals)
+    assert np.allclose(result.vertices[3], closest_point_on_line(result.vertices[3], line))
@@ -0,0 +1,21 @@
+import numpy as np
+from compas_fd.fd.fd_matrices import connectivity_matrix
+from compas_fd.fd.fd_matrices import stiffness_matrix
+
+
+def test_connectivity_matrix():
+    edges = [(0, 1), (0, 2), (0, 3)]
+    C = connectivity_matrix(edges, 5)
+    assert C.shape == (3, 5)
+    assert np.allclose(C.toarray(), [[-1, 1, 0, 0, 0],
+                                     [-1, 0, 1, 0, 0],
+                                     [-1, 0, 0, 1, 0]])
+
+
+def test_stiffness_matrix():
+    edges = [(0, 1), (1, 2), (2, 0), (2, 3)]
+    q = [1.0, 2.0, 3.0, 4.0]
+    C = connectivity_matrix(edges, 5)
+    A = stiffness_matrix(edges, q, 5)
+    assert A.shape == (5, 5)
+    assert np.allclose(A.toarray(), C.T.dot(np.diag(q)).dot(C.toarray()))
@@ -0,0 +1,23 @@
+import numpy as np
+import compas
+from compas_fd.datastructures import CableMesh
+from compas_fd.fd.fd_numerical_data import FDNumericalData
+
+
+def test_to_numdata():
+    mesh = CableMesh.from_obj(compas.get('faces.obj'))
+    anchors = list(mesh.vertices_where({'vertex_degree': 2}))
+    mesh.vertices_attribute('is_anchor', True, keys=anchors)
+    mesh.vertices_attribute('pz', -1.0)
+    numdata = mesh.to_numdata()
+    k_i = mesh.key_index()
+    assert np.allclose(numdata.xyz, mesh.vertices_attributes('xyz'))
+    assert np.allclose(numdata.loads[:, 2], -1.0)
+    assert sorted(numdata.fixed.tolist()) == sorted(k_i[key] for key in anchors)
+    assert numdata.edges.tolist() == [[k_i[u], k_i[v]] for u, v in mesh.edges()]
+    assert numdata.forcedensities.shape == (mesh.number_of_edges(), 1)
+    assert len(numdata.constraints) == mesh.number_of_vertices()
+
+    nd = FDNumericalData.from_mesh(mesh)
+    assert np.array_equal(nd.fixed, numdata.fixed)
+    assert nd.A.shape == (mesh.number_of_vertices(), mesh.number_of_vertices())
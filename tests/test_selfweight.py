@@ -0,0 +1,14 @@
+import numpy as np
+import compas
+from compas_fd.datastructures import CableMesh
+from compas_fd.loads import SelfweightCalculator
+
+
+def test_selfweight_flat():
+    mesh = CableMesh.from_obj(compas.get('faces.obj'))
+    mesh.vertices_attribute('t', 0.1)
+    calculate_sw = SelfweightCalculator(mesh, density=22.0)
+    xyz = np.array(mesh.vertices_attributes('xyz'))
+    sw = calculate_sw(xyz)
+    assert sw.shape == (mesh.number_of_vertices(), 1)
+    assert np.isclose(sw.sum(), mesh.area() * 0.1 * 22.0)